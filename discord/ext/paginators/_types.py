@@ -51,5 +51,6 @@ class BasePaginatorKwargs(TypedDict):
     disable_after: NotRequired[bool]  # default: False
     clear_buttons_after: NotRequired[bool]  # default: False
     per_page: NotRequired[int]  # default: 1
+    cache_page_kwargs: NotRequired[bool]  # default: False
     timeout: NotRequired[Optional[Union[int, float]]]  # default: 180.0
     message: NotRequired[discord.Message]  # default: None
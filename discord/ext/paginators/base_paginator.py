@@ -3,7 +3,12 @@ from typing import TYPE_CHECKING, Any, Callable, Generic, Literal, Optional, Uni
 
 from collections.abc import Sequence, Coroutine
 
+from collections import OrderedDict
+from weakref import WeakKeyDictionary
+import asyncio
+
 import discord
+from discord import Attachment, Embed, File
 
 from ._types import PageT
 from . import utils as _utils
@@ -18,6 +23,79 @@ else:
 
 __all__ = ("BaseClassPaginator",)
 
+# the amount of pages to keep the kwargs of if cache_page_kwargs is True
+_PAGE_KWARGS_CACHE_SIZE = 32
+# kwargs that can be compared to skip editing the message if nothing changed
+_COMPARABLE_MESSAGE_KWARGS = frozenset(("content", "embeds", "view", "files", "attachments", "ephemeral"))
+# the bot owner ids per client, shared between all paginators so they're only fetched once
+_BOT_OWNER_IDS: WeakKeyDictionary[discord.Client, frozenset[int]] = WeakKeyDictionary()
+
+
+# The functions below apply one entry of a page to the base kwargs, see BaseClassPaginator.__apply_page.
+# Files are only collected since they still have to be copied and
+# sequences are pushed to the stack, reversed so that the entries are still handled in order.
+_PageHandler = Callable[[dict[str, Any], list[Any], list[Any], Any], None]
+
+
+def _apply_sequence(kwargs: dict[str, Any], files: list[Any], stack: list[Any], page: Sequence[Any]) -> None:
+    stack.extend(reversed(page))
+
+
+def _apply_text(kwargs: dict[str, Any], files: list[Any], stack: list[Any], page: Union[int, str]) -> None:
+    if kwargs["content"]:
+        kwargs["content"] += str(page)
+    else:
+        kwargs["content"] = str(page)
+
+
+def _apply_embed(kwargs: dict[str, Any], files: list[Any], stack: list[Any], page: Embed) -> None:
+    kwargs["embeds"].append(page)
+
+
+def _apply_file(kwargs: dict[str, Any], files: list[Any], stack: list[Any], page: Union[File, Attachment]) -> None:
+    files.append(page)
+
+
+def _apply_dict(kwargs: dict[str, Any], files: list[Any], stack: list[Any], page: dict[str, Any]) -> None:
+    kwargs.update(page)
+
+
+_PAGE_HANDLERS: dict[type[Any], _PageHandler] = {
+    list: _apply_sequence,
+    tuple: _apply_sequence,
+    str: _apply_text,
+    int: _apply_text,
+    Embed: _apply_embed,
+    File: _apply_file,
+    Attachment: _apply_file,
+    dict: _apply_dict,
+}
+
+
+def _has_files(page: Any) -> bool:
+    # files and attachments have to be copied or downloaded, see BaseClassPaginator._is_slow_to_render.
+    stack: list[Any] = [page]
+    while stack:
+        inner_page = stack.pop()
+        if isinstance(inner_page, (File, Attachment)):
+            return True
+        if isinstance(inner_page, (list, tuple)):
+            stack.extend(inner_page)  # type: ignore # it's a list or tuple
+        elif isinstance(inner_page, dict) and (inner_page.get("files") or inner_page.get("attachments")):  # type: ignore
+            return True
+
+    return False
+
+
+def _get_page_handler(page_type: type[Any]) -> Optional[_PageHandler]:
+    # for subclasses of the supported types, the closest base class wins.
+    for cls in page_type.__mro__:
+        if handler := _PAGE_HANDLERS.get(cls):
+            return handler
+
+    return None
+
+
 class BaseClassPaginator(discord.ui.View, Generic[PageT]):
     """Base class for all paginators.
 
@@ -34,7 +112,8 @@ class BaseClassPaginator(discord.ui.View, Generic[PageT]):
         - :class:`dict`: Will be updated with the kwargs of the message.
         - Sequence[Any]: Will be flattened and each entry will be handled as above.
 
-        Sequence = List, Tuple, etc.
+        Sequence = List, Tuple, etc. Any object that supports ``len()`` and indexing can be passed
+        as ``pages`` itself, like a :class:`range`. It's not copied into a list.
 
         Any other types will probably be ignored.
         This attribute *should* be able to be set after the paginator is created.
@@ -79,7 +158,15 @@ class BaseClassPaginator(discord.ui.View, Generic[PageT]):
         If the page is an embed, it will be appended to the footer text.
         If the page is a string, it will be appended to the string.
         else, it will be set as the content of the message.
+    cache_page_kwargs: :class:`bool`
+        Whether to cache the kwargs of a page after they're built for the first time. Defaults to ``False``.
+        Going back to a cached page then skips :meth:`.BaseClassPaginator.format_page`,
+        :meth:`.BaseClassPaginator.get_page_kwargs` and downloading attachments again.
 
+        Only enable this if a page always results in the same message. Up to 32 pages are cached, the least
+        recently shown page is dropped first. The cache is cleared when ``pages`` or ``per_page`` is set.
+
+        .. versionadded:: 0.3.0
     timeout: Optional[Union[:class:`int`, :class:`float`]]
         The timeout for the paginator.
         Defaults to ``180.0``.
@@ -98,18 +185,25 @@ class BaseClassPaginator(discord.ui.View, Generic[PageT]):
         clear_buttons_after: bool = False,
         message: Optional[discord.Message] = None,
         add_page_string: bool = True,
+        cache_page_kwargs: bool = False,
         timeout: Optional[Union[int, float]] = 180.0,
     ) -> None:
         super().__init__(timeout=timeout)
 
-        if not pages:
-            raise ValueError("No pages provided.")
+        self.cache_page_kwargs: bool = cache_page_kwargs
+        self.__page_kwargs_cache: OrderedDict[Any, dict[str, Any]] = OrderedDict()
+
+        self.__validate_pages(pages)
         if per_page < 1:
             raise ValueError("per_page must be greater than 0.")
 
-        self.pages: Sequence[PageT] = pages
-        self.per_page: int = per_page
-        self.max_pages: int = len(pages) // per_page + bool(len(pages) % per_page)
+        self._pages: Sequence[PageT] = pages
+        self._per_page: int = per_page
+        self.max_pages: int = 0  # set in __update_pages_info
+        self.__get_page_impl: Callable[[int], Union[PageT, Sequence[PageT]]]
+        self.__page_slices: list[slice]
+        self.__page_strings: dict[int, str] = {}
+        self.__update_pages_info()
 
         self._current_page: int = 0
 
@@ -133,23 +227,90 @@ class BaseClassPaginator(discord.ui.View, Generic[PageT]):
 
         self.message: Optional[discord.Message] = message
 
-        self.__owner_ids: Optional[set[int]] = None
+        self.__last_message_signature: Optional[tuple[Any, ...]] = None
+        # see switch_page
+        self.__switching_page: bool = False
+        self.__switch_page_pending: bool = False
 
-        self._reset_base_kwargs()
+        # created once and cleared in place by _reset_base_kwargs on every render
+        self.__embeds: list[Embed] = []
+        # typed like BaseKwargs["files"] since lists are invariant, only the copied files are added
+        self.__files: list[Union[File, Attachment]] = []
+        self.__base_kwargs: BaseKwargs = {"content": None, "embeds": self.__embeds, "files": self.__files, "view": self}
 
     async def __is_bot_owner(self, interaction: discord.Interaction[Any]) -> bool:
         """Checks if the interaction's user is one of the bot owners."""
-        if self.__owner_ids is None:
-            self.__owner_ids = await _utils._fetch_bot_owner_ids(interaction.client)
+        client = interaction.client
+        owner_ids = _BOT_OWNER_IDS.get(client)
+        if owner_ids is None:
+            owner_ids = _BOT_OWNER_IDS[client] = await _utils._fetch_bot_owner_ids(client)
 
-        return interaction.user.id in self.__owner_ids
+        return interaction.user.id in owner_ids
 
     def _reset_base_kwargs(self) -> None:
         """Resets the base kwargs.
 
-        This sets the base kwargs to ``{"content": None, "embeds": [], "view": self}``.
+        This sets the base kwargs to ``{"content": None, "embeds": [], "files": [], "view": self}``.
+        The same embeds and files lists are reused and cleared in place instead of being reallocated.
+        """
+        self.__embeds.clear()
+        self.__files.clear()
+        # a new dict since a dict page can add any key to it
+        self.__base_kwargs = {"content": None, "embeds": self.__embeds, "files": self.__files, "view": self}
+
+    @staticmethod
+    def __validate_pages(pages: Any) -> None:
+        # any object with a length that can be indexed works, no need to copy it into a list.
+        if not hasattr(pages, "__len__") or not hasattr(pages, "__getitem__"):
+            raise TypeError(f"pages must be a sequence that supports len() and indexing, not {pages.__class__.__name__}.")
+        if not pages:
+            raise ValueError("No pages provided.")
+
+    def __update_pages_info(self) -> None:
+        """Updates :attr:`max_pages` and picks how :meth:`get_page` looks up a page.
+
+        This is called whenever :attr:`pages` or :attr:`per_page` is set.
         """
-        self.__base_kwargs: BaseKwargs = {"content": None, "embeds": [], "view": self}
+        per_page = self._per_page
+        # ceiling division
+        self.max_pages = -(-len(self._pages) // per_page)
+        self.__page_kwargs_cache.clear()
+        self.__page_strings.clear()
+        if per_page == 1:
+            self.__page_slices = []
+            self.__get_page_impl = self._pages.__getitem__
+        else:
+            self.__page_slices = [slice(start, start + per_page) for start in range(0, len(self._pages), per_page)]
+            self.__get_page_impl = self.__get_page_slice
+
+    def __get_page_slice(self, page_number: int) -> Union[PageT, Sequence[PageT]]:
+        page = self._pages[self.__page_slices[page_number]]
+        # slices of a list or tuple are handled as is, others like a range are turned into a list of pages.
+        return page if isinstance(page, (list, tuple)) else list(page)
+
+    @property
+    def pages(self) -> Sequence[PageT]:
+        """Sequence[Any]: The pages to paginate. Setting this also updates :attr:`max_pages`."""
+        return self._pages
+
+    @pages.setter
+    def pages(self, value: Sequence[PageT]) -> None:
+        self.__validate_pages(value)
+        self._pages = value
+        self.__update_pages_info()
+
+    @property
+    def per_page(self) -> int:
+        """:class:`int`: The amount of pages to display per page. Setting this also updates :attr:`max_pages`."""
+        return self._per_page
+
+    @per_page.setter
+    def per_page(self, value: int) -> None:
+        if value < 1:
+            raise ValueError("per_page must be greater than 0.")
+
+        self._per_page = value
+        self.__update_pages_info()
 
     @property
     def current_page(self) -> int:
@@ -164,12 +325,21 @@ class BaseClassPaginator(discord.ui.View, Generic[PageT]):
     @property
     def page_string(self) -> str:
         """:class:`str`: A string representing the current page and the max pages."""
-        return f"Page {self.current_page + 1} of {self.max_pages}"
+        return self.__get_page_string(self.current_page)
+
+    def __get_page_string(self, page_number: int) -> str:
+        # the strings are built once per page, pages can be a huge range so not all upfront.
+        try:
+            return self.__page_strings[page_number]
+        except KeyError:
+            page_string = self.__page_strings[page_number] = f"Page {page_number + 1} of {self.max_pages}"
+            return page_string
 
     def stop(self) -> None:
         """Stops the view and resets the base kwargs."""
         self._reset_base_kwargs()
         self.message = None
+        self.__last_message_signature = None
         return super().stop()
 
     async def on_timeout(self) -> None:
@@ -197,13 +367,14 @@ class BaseClassPaginator(discord.ui.View, Generic[PageT]):
         :class:`bool`
             Whether the interaction is valid or not.
         """
+        # cheapest check first, the bot owner check might have to fetch the owners
+        if self.author_id is not None and interaction.user.id == self.author_id:
+            return True
+
         if self.always_allow_bot_owner:
             if await self.__is_bot_owner(interaction):
                 return True
 
-        if self.author_id is not None and interaction.user.id == self.author_id:
-            return True
-
         if self._check is not None:
             return await discord.utils.maybe_coroutine(self._check, self, interaction)
 
@@ -214,8 +385,8 @@ class BaseClassPaginator(discord.ui.View, Generic[PageT]):
 
         This method does the following checks (in order):
 
-        - If ``always_allow_bot_owner`` is ``True``, it checks if the interaction's author id is one of the bot owners.
         - If ``author_id`` is not ``None``, it checks if the interaction's author id is the same as the one set.
+        - If ``always_allow_bot_owner`` is ``True``, it checks if the interaction's author id is one of the bot owners.
         - If ``check`` is not ``None``, it calls it and checks if it returns ``True``.
         - If none of the above checks are ``True``, it calls :meth:`discord.ui.View.interaction_check`.
 
@@ -229,6 +400,19 @@ class BaseClassPaginator(discord.ui.View, Generic[PageT]):
     def _do_format_page(self, page: Union[PageT, Sequence[PageT]]) -> Coroutine[Any, Any, Union[PageT, Sequence[PageT]]]:
         return discord.utils.maybe_coroutine(self.format_page, page)
 
+    def _is_format_page_overridden(self) -> bool:
+        """Whether the page is formatted by anything other than the default :meth:`.BaseClassPaginator.format_page`.
+
+        The default returns the page as is and doesn't have to be awaited, see :meth:`.BaseClassPaginator.get_page_kwargs`.
+        Checked on every render since ``format_page`` can also be set on the instance.
+        """
+        format_page: Any = self.format_page
+        do_format_page: Any = self._do_format_page
+        return (
+            getattr(format_page, "__func__", None) is not _DEFAULT_FORMAT_PAGE
+            or getattr(do_format_page, "__func__", None) is not _DEFAULT_DO_FORMAT_PAGE
+        )
+
     async def format_page(self, page: Union[PageT, Sequence[PageT]]) -> Union[PageT, Sequence[PageT]]:
         """This method can be overridden to format the page before sending it.
         By default, it returns the page as is.
@@ -294,36 +478,96 @@ class BaseClassPaginator(discord.ui.View, Generic[PageT]):
         Union[Any], Sequence[Any]]
             The page(s) with the given page number.
         """
-        # handle per_page
         if page_number < 0 or page_number >= self.max_pages:
             self.current_page = 0
-            return self.pages[self.current_page]
+            return self.__get_page_impl(0)
 
-        if self.per_page == 1:
-            return self.pages[page_number]
-        else:
-            base = page_number * self.per_page
-            return self.pages[base : base + self.per_page]
+        # either a plain index or a precomputed slice for per_page, see __update_pages_info
+        return self.__get_page_impl(page_number)
+
+    def _get_page_kwargs_cache_key(self) -> Any:
+        """Returns the key the kwargs of the current page are cached with if ``cache_page_kwargs`` is ``True``."""
+        return self._current_page
+
+    def _is_slow_to_render(self) -> bool:
+        """Whether getting the kwargs of the current page might take a while.
+
+        The interaction is deferred first if so, otherwise it's responded to with the edit itself.
+        That's the case if :meth:`.BaseClassPaginator.format_page` is overridden or if the page has files,
+        unless the kwargs of the page are cached.
+        """
+        if self.cache_page_kwargs and (self._get_page_kwargs_cache_key(), self.add_page_string) in self.__page_kwargs_cache:
+            return False
+
+        return self._is_format_page_overridden() or _has_files(self.get_page(self.current_page))
+
+    async def _get_current_page_kwargs(self) -> BaseKwargs:
+        """Gets the kwargs to send the current page with, including the page string.
+
+        If ``cache_page_kwargs`` is ``True``, the kwargs are taken from or stored in the cache.
+        """
+        # the page can be switched while the page is formatted, the page string has to be of the same page.
+        page_number = self.current_page
+        page = self.get_page(page_number)
+        if not self.cache_page_kwargs:
+            page_kwargs = await self.get_page_kwargs(page)
+            self._handle_page_string(page_number)
+            return page_kwargs
+
+        cache = self.__page_kwargs_cache
+        key = (self._get_page_kwargs_cache_key(), self.add_page_string)
+        cached = cache.get(key)
+        if cached is not None:
+            cache.move_to_end(key)
+            # copies since the kwargs are updated by _send and discord.py reads the files.
+            cached_kwargs = cached.copy()
+            cached_kwargs["embeds"] = cached["embeds"].copy()
+            if files := cached.get("files"):
+                cached_kwargs["files"] = await asyncio.gather(*map(_utils._new_file, files))
+
+            return cached_kwargs  # type: ignore # it's a copy of BaseKwargs
+
+        page_kwargs = await self.get_page_kwargs(page)
+        self._handle_page_string(page_number)
+        if self._get_page_kwargs_cache_key() != key[0]:
+            # switched while getting the kwargs, these might not be of the page the key is of anymore.
+            return page_kwargs
+
+        # the base kwargs and the user's embeds are reused or changed on the next render
+        to_cache: dict[str, Any] = dict(page_kwargs)
+        to_cache["embeds"] = [embed.copy() for embed in page_kwargs["embeds"]]
+        if "files" in page_kwargs:
+            to_cache["files"] = list(page_kwargs["files"])
+
+        cache[key] = to_cache
+        if len(cache) > _PAGE_KWARGS_CACHE_SIZE:
+            cache.popitem(last=False)
+
+        return page_kwargs
 
-    def _handle_page_string(self) -> None:
+    def _handle_page_string(self, page_number: Optional[int] = None) -> None:
         if not self.add_page_string:
             return
 
+        page_string = self.page_string if page_number is None else self.__get_page_string(page_number)
         embeds = self.__base_kwargs.get("embeds", [])
         content = self.__base_kwargs.get("content")
         if embeds:
             for embed in embeds:
-                to_set = self.page_string
-                if footer_text := embed.footer.text:
-                    if "|" in footer_text:
-                        footer_text = footer_text.split("|")[0].strip()
-                        to_set = f"{footer_text} | {self.page_string}"
-
-                embed.set_footer(text=to_set)
+                to_set = page_string
+                footer = embed.footer
+                if footer_text := footer.text:
+                    head, sep, _ = footer_text.partition("|")
+                    if sep:
+                        to_set = f"{head.strip()} | {page_string}"
+
+                # only touch the footer if the text changed and keep its icon
+                if footer_text != to_set:
+                    embed.set_footer(text=to_set, icon_url=footer.icon_url)
         elif content:
-            self.__base_kwargs["content"] = f"{content}\n{self.page_string}"
+            self.__base_kwargs["content"] = f"{content}\n{page_string}"
         else:
-            self.__base_kwargs["content"] = self.page_string
+            self.__base_kwargs["content"] = page_string
 
     async def get_page_kwargs(self, page: Union[PageT, Sequence[PageT]], /, skip_formatting: bool = False) -> BaseKwargs:
         """Gets the kwargs to send the page with.
@@ -343,43 +587,76 @@ class BaseClassPaginator(discord.ui.View, Generic[PageT]):
         """
         if not skip_formatting:
             self._reset_base_kwargs()
-            _page = await self._do_format_page(page)
-            return await self.get_page_kwargs(_page, skip_formatting=True)
-
-        # Sequence
-        if isinstance(page, (list, tuple)):
-            inner_page: Any
-            for inner_page in page:
-                # handles the page kwargs
-                await self.get_page_kwargs(inner_page, skip_formatting=True)
-
-        if isinstance(page, (int, str)):
-            if self.__base_kwargs["content"]:
-                self.__base_kwargs["content"] += str(page)
+            if self._is_format_page_overridden():
+                page = await self._do_format_page(page)
             else:
-                self.__base_kwargs["content"] = str(page)
-        elif isinstance(page, discord.Embed):
-            self.__base_kwargs["embeds"].append(page)
-        elif isinstance(page, (discord.File, discord.Attachment)):
-            file = await _utils._new_file(page)
-            try:
-                self.__base_kwargs["files"].append(file)  # type: ignore # yeah no
-            except KeyError:
-                self.__base_kwargs["files"] = [file]
-
-        elif isinstance(page, dict):
-            # kinda the same thing as above but it didn't appricate that it
-            # didn't know the type of the key&value so it was "dict[Unknown, Unknown]"
-            data: dict[Any, Any] = page.copy()
-            self.__base_kwargs.update(data)
+                # format_page returns the page as is, the most common pages can be set directly.
+                page_type = type(page)
+                if page_type is str:
+                    self.__base_kwargs["content"] = page  # type: ignore # it's a str
+                    return self.__base_kwargs
+                if page_type is Embed:
+                    self.__embeds.append(page)  # type: ignore # it's an Embed
+                    return self.__base_kwargs
+
+        files = self.__apply_page(page)
+        files_list = self.__base_kwargs.get("files")
+        if files_list is not self.__files:
+            # set by a dict page, these are copied like the others and the user's list is left as is.
+            files = [*(files_list or ()), *files]
+            self.__base_kwargs["files"] = self.__files
+
+        if files:
+            # copies are made concurrently since Attachment.to_file() downloads the file.
+            self.__files.extend(await asyncio.gather(*map(_utils._new_file, files)))
 
         return self.__base_kwargs
 
+    def __apply_page(self, page: Union[PageT, Sequence[PageT]], /) -> list[Union[File, Attachment]]:
+        """Applies the (formatted) page to the base kwargs.
+
+        Returns the files and attachments of the page, these still have to be copied.
+        """
+        files: list[Union[File, Attachment]] = []
+        base_kwargs: dict[str, Any] = self.__base_kwargs  # type: ignore # it's a TypedDict
+        # sequences are flattened with an explicit stack instead of recursing.
+        stack: list[Any] = [page]
+        while stack:
+            inner_page = stack.pop()
+            page_type: type[Any] = inner_page.__class__
+            handler = _PAGE_HANDLERS.get(page_type) or _get_page_handler(page_type)
+            # any other types are ignored
+            if handler is not None:
+                handler(base_kwargs, files, stack, inner_page)
+
+        return files
+
     def _disable_all_children(self) -> None:
         for child in self.children:
             if hasattr(child, "disabled"):
                 child.disabled = True  # type: ignore # not all children have disabled attr.
 
+    @staticmethod
+    def __get_message_signature(message: Optional[discord.Message], kwargs: dict[str, Any]) -> Optional[tuple[Any, ...]]:
+        """Returns which message would look like what with the given kwargs, to compare it with the last one.
+
+        Returns ``None`` if the kwargs can't be compared. E.g. when there are files or other kwargs
+        or when it's unknown which message is edited.
+        """
+        if message is None:
+            return None
+
+        if kwargs.get("files") or kwargs.get("attachments") or not _COMPARABLE_MESSAGE_KWARGS.issuperset(kwargs):
+            return None
+
+        view = kwargs.get("view")
+        return (
+            message.id,
+            kwargs.get("content"),
+            [embed.to_dict() for embed in kwargs.get("embeds", ())],
+            view.to_components() if isinstance(view, discord.ui.View) else view,
+        )
+
     async def _edit_message(self, interaction: Optional[discord.Interaction[Any]] = None, /, **kwargs: Any) -> None:
         """Edits the message with the given kwargs.
 
@@ -397,22 +674,30 @@ class BaseClassPaginator(discord.ui.View, Generic[PageT]):
         """
         kwargs.pop("ephemeral", None)
 
-        files_to_edit: list[discord.File] = []
+        # the message the interaction is from is edited, not always the one of this paginator.
+        message = interaction.message if interaction else self.message
+        signature = self.__get_message_signature(message, kwargs)
+        if signature is not None and signature == self.__last_message_signature:
+            # the message would look exactly the same, only acknowledge the interaction.
+            if interaction and not interaction.response.is_done():
+                await interaction.response.defer()
+        else:
+            # the files are already copied in get_page_kwargs, only attachments still have to be.
+            files: list[File] = list(kwargs.pop("files", ()))
+            if attachments := kwargs.pop("attachments", None):
+                files.extend(await asyncio.gather(*map(_utils._new_file, attachments)))
 
-        atachments_or_Files = kwargs.pop("files", []) + kwargs.pop("attachments", [])
-        if atachments_or_Files:
-            for file in atachments_or_Files:
-                files_to_edit.append(await _utils._new_file(file))
+            kwargs["attachments"] = files
 
-        kwargs["attachments"] = files_to_edit
+            if interaction:
+                if interaction.response.is_done():
+                    await interaction.edit_original_response(**kwargs)
+                else:
+                    await interaction.response.edit_message(**kwargs)
+            elif self.message:
+                await self.message.edit(**kwargs)
 
-        if interaction:
-            if interaction.response.is_done():
-                await interaction.edit_original_response(**kwargs)
-            else:
-                await interaction.response.edit_message(**kwargs)
-        elif self.message:
-            await self.message.edit(**kwargs)
+            self.__last_message_signature = signature
 
         if self.is_finished():
             await self.stop_paginator()
@@ -426,12 +711,40 @@ class BaseClassPaginator(discord.ui.View, Generic[PageT]):
             The interaction to edit. If ``None``, ``.message`` is used.
         page_number: :class:`int`
             The page number to switch to.
+
+        If the message is still being edited because of an earlier switch, only the page
+        is changed here and the earlier switch edits the message to the latest page after.
         """
         self.current_page = page_number
-        page = self.get_page(self.current_page)
-        page_kwargs = await self.get_page_kwargs(page)
-        self._handle_page_string()
-        await self._edit_message(interaction, **page_kwargs)
+        if self.__switching_page:
+            # the message is already being edited, the running switch
+            # edits it once more to the latest page when it's done.
+            self.__switch_page_pending = True
+            if interaction and not interaction.response.is_done():
+                await interaction.response.defer()
+            return
+
+        # set before anything is awaited, so a concurrent switch can't pass the check above as well.
+        self.__switching_page = True
+        try:
+            # acknowledge the interaction right away if the page might take a while, so the user gets
+            # feedback and the message is edited afterwards. Otherwise the edit is the response.
+            if interaction and not interaction.response.is_done() and self._is_slow_to_render():
+                await interaction.response.defer()
+
+            while True:
+                self.__switch_page_pending = False
+                key = self._get_page_kwargs_cache_key()
+                page_kwargs = await self._get_current_page_kwargs()
+                if self._get_page_kwargs_cache_key() != key:
+                    # switched again while getting the kwargs, the latest page is sent instead of this one.
+                    continue
+
+                await self._edit_message(interaction, **page_kwargs)
+                if not self.__switch_page_pending or self.is_finished():
+                    break
+        finally:
+            self.__switching_page = False
 
     @overload
     async def send(
@@ -516,18 +829,19 @@ class BaseClassPaginator(discord.ui.View, Generic[PageT]):
         edit_message: bool = False,
         **send_kwargs: Any,
     ) -> Optional[discord.Message]:
-        page = self.get_page(self.current_page)
-        page_kwargs: dict[str, Any] = await self.get_page_kwargs(page)  # type: ignore # TypedDict don't go well with overloads
-        self._handle_page_string()
+        page_kwargs: dict[str, Any] = await self._get_current_page_kwargs()  # type: ignore # TypedDict don't go well with overloads
         if override_page_kwargs:
-            page_kwargs |= send_kwargs
+            page_kwargs.update(send_kwargs)
 
+        # the base kwargs always have a files list, only send it if there are any
+        if not page_kwargs.get("files"):
+            page_kwargs.pop("files", None)
+
+        is_interaction = isinstance(destination, discord.Interaction)
         if edit_message:
-            return await self._edit_message(
-                destination if isinstance(destination, discord.Interaction) else None, **page_kwargs
-            )
+            return await self._edit_message(destination if is_interaction else None, **page_kwargs)
 
-        elif isinstance(destination, discord.Interaction):
+        elif is_interaction:
             if destination.response.is_done():
                 self.message = await destination.followup.send(**page_kwargs, wait=True)
             else:
@@ -538,4 +852,10 @@ class BaseClassPaginator(discord.ui.View, Generic[PageT]):
         else:
             self.message = await destination.send(**page_kwargs)
 
+        self.__last_message_signature = self.__get_message_signature(self.message, page_kwargs)
         return self.message
+
+
+# the default formatting hooks, see BaseClassPaginator._is_format_page_overridden
+_DEFAULT_FORMAT_PAGE: Any = BaseClassPaginator[Any].format_page
+_DEFAULT_DO_FORMAT_PAGE: Any = BaseClassPaginator[Any]._do_format_page
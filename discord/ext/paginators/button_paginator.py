@@ -1,6 +1,7 @@
 from __future__ import annotations
 from typing import TYPE_CHECKING, Any, Literal, Optional, Union
-from collections.abc import Sequence
+from collections.abc import Callable, Coroutine, Sequence
+from types import MappingProxyType
 
 from discord import ButtonStyle, Emoji, PartialEmoji
 import discord
@@ -21,17 +22,36 @@ if TYPE_CHECKING:
 
 __all__: tuple[str, ...] = ("ButtonPaginator", "PaginatorButton")
 
+# the custom_ids of the buttons, the same string objects are used everywhere
+_CID_FIRST = "first_button"
+_CID_LEFT = "left_button"
+_CID_PAGE_INDICATOR = "page_indicator_button"
+_CID_RIGHT = "right_button"
+_CID_LAST = "last_button"
+_CID_STOP = "stop_button"
+_CID_SWITCH_PAGE = "switch_page"
+
+# the custom_id of each button by its key in ButtonPaginator._buttons
+_CUSTOM_IDS: dict[str, str] = {
+    "FIRST": _CID_FIRST,
+    "LEFT": _CID_LEFT,
+    "PAGE_INDICATOR": _CID_PAGE_INDICATOR,
+    "RIGHT": _CID_RIGHT,
+    "LAST": _CID_LAST,
+    "STOP": _CID_STOP,
+}
+# the key in ButtonPaginator._buttons of each button by its custom_id
+_BUTTON_KEYS: dict[str, str] = {custom_id: key for key, custom_id in _CUSTOM_IDS.items()}
+# the buttons that are disabled on the last page and the ones on the first page
+_FORWARD_BUTTONS = frozenset((_CID_RIGHT, _CID_LAST))
+_BACKWARD_BUTTONS = frozenset((_CID_LEFT, _CID_FIRST))
+# the buttons that show the page they go to in their label
+_EDGE_BUTTONS = frozenset((_CID_FIRST, _CID_LAST))
+_EDGE_BUTTON_KEYS = frozenset(("FIRST", "LAST"))
+
 
 class ChooseNumber(Modal):
-    number_input: TextInput[Any] = TextInput(
-        placeholder="Current: {0}",
-        label="Enter a number between 1 and {0}",
-        custom_id="paginator:textinput:choose_number",
-        max_length=0,
-        min_length=1,
-    )
-
-    def __init__(self, paginator: ButtonPaginator[Any], /, **kwargs: Any) -> None:
+    def __init__(self, paginator: ButtonPaginator[Any], /, *, switch_page: bool = False, **kwargs: Any) -> None:
         super().__init__(
             title="Which page would you like to go to?",
             timeout=paginator.timeout,
@@ -39,36 +59,39 @@ class ChooseNumber(Modal):
             **kwargs,
         )
         self.paginator: ButtonPaginator[Any] = paginator
-        self.number_input.max_length = paginator.max_pages
-        self.number_input.label = self.number_input.label.format(paginator.max_pages)
-
-        # type checker
-        if not self.number_input.placeholder:
-            self.number_input.placeholder = f"Current: {paginator.current_page + 1}"
-        else:
-            self.number_input.placeholder = self.number_input.placeholder.format(paginator.current_page + 1)
+        # whether to switch to the chosen page with the submit interaction
+        # instead of only setting value for whoever is waiting on the modal.
+        self.switch_page: bool = switch_page
+        # built here instead of in the class body since it depends on the paginator
+        self.number_input: TextInput[Any] = TextInput(
+            placeholder=f"Current: {paginator.current_page + 1}",
+            label=f"Enter a number between 1 and {paginator.max_pages}",
+            custom_id="paginator:textinput:choose_number",
+            max_length=len(str(paginator.max_pages)),
+            min_length=1,
+        )
+        self.add_item(self.number_input)
 
         self.value: Optional[int] = None
 
     async def on_submit(self, interaction: discord.Interaction[Any]) -> None:
+        value = self.number_input.value
         # can't happen but type checker
-        if not self.number_input.value:
+        if not value:
             await interaction.response.send_message("Please enter a number!", ephemeral=True)
             self.stop()
             return
 
-        if (
-            not self.number_input.value.isdigit()
-            or int(self.number_input.value) <= 0
-            or int(self.number_input.value) > self.paginator.max_pages
-        ):
-            await interaction.response.send_message(
-                f"Please enter a valid number between 1 and {self.paginator.max_pages}", ephemeral=True
-            )
+        max_pages = self.paginator.max_pages
+        # isdecimal since isdigit also allows characters like "²" that int() can't parse,
+        # the length is checked as well in case max_length isn't enforced.
+        number = int(value) if value.isdecimal() and len(value) <= len(str(max_pages)) else 0
+        if not 1 <= number <= max_pages:
+            await interaction.response.send_message(f"Please enter a valid number between 1 and {max_pages}", ephemeral=True)
             self.stop()
             return
 
-        number = int(self.number_input.value) - 1
+        number -= 1
 
         if number == self.paginator.current_page:
             await interaction.response.send_message("That is the current page!", ephemeral=True)
@@ -76,8 +99,11 @@ class ChooseNumber(Modal):
             return
 
         self.value = number
-        await interaction.response.defer()
         self.stop()
+        if self.switch_page:
+            await self.paginator.switch_page(interaction, number)
+        else:
+            await interaction.response.defer()
 
 
 class PageSwitcherAndStopButtonView(discord.ui.View):
@@ -89,15 +115,12 @@ class PageSwitcherAndStopButtonView(discord.ui.View):
 
     def _add_buttons(self, paginator: ButtonPaginator[Any], /) -> None:
         self._paginator: ButtonPaginator[Any] = paginator
-        if not any(key in ("STOP", "PAGE_INDICATOR") for key in paginator._buttons):
-            raise ValueError("STOP and PAGE_INDICATOR buttons are required if combine_switcher_and_stop_button is True.")
-
         org_page_indicator_button: PaginatorButton = paginator._buttons["PAGE_INDICATOR"]
         page_indicator_button = PaginatorButton(
             label="Switch Page",
             emoji=org_page_indicator_button.emoji,
             style=org_page_indicator_button.style,
-            custom_id="switch_page",
+            custom_id=_CID_SWITCH_PAGE,
             disabled=False,
         )
 
@@ -106,7 +129,7 @@ class PageSwitcherAndStopButtonView(discord.ui.View):
             label=org_stop_button.label,
             emoji=org_stop_button.emoji,
             style=org_stop_button.style,
-            custom_id="stop_button",
+            custom_id=_CID_STOP,
             disabled=False,
         )
         buttons: dict[str, PaginatorButton] = {
@@ -118,13 +141,13 @@ class PageSwitcherAndStopButtonView(discord.ui.View):
             self.add_item(button)
 
     async def callback(self, interaction: discord.Interaction[Any], button: PaginatorButton) -> None:
-        if button.custom_id == "stop_button":
+        if button.custom_id == _CID_STOP:
             await interaction.response.defer()
             await interaction.delete_original_response()
             await self._paginator.stop_paginator(None)
             return
 
-        if button.custom_id == "switch_page":
+        if button.custom_id == _CID_SWITCH_PAGE:
             new_page = await self._paginator._handle_modal(interaction)
             await interaction.delete_original_response()
             if new_page is not None:
@@ -135,6 +158,50 @@ class PageSwitcherAndStopButtonView(discord.ui.View):
         await self._paginator.switch_page(None, self._paginator.current_page)
 
 
+# The actions of the paginator's buttons by their custom_id, see PaginatorButton.callback.
+# The navigation buttons only return the page to switch to, the others respond to the interaction themselves.
+def _go_first(paginator: ButtonPaginator[Any]) -> int:
+    return 0
+
+
+def _go_left(paginator: ButtonPaginator[Any]) -> int:
+    return paginator.current_page - 1
+
+
+def _go_right(paginator: ButtonPaginator[Any]) -> int:
+    return paginator.current_page + 1
+
+
+def _go_last(paginator: ButtonPaginator[Any]) -> int:
+    return paginator.max_pages - 1
+
+
+async def _stop(paginator: ButtonPaginator[Any], interaction: discord.Interaction[Any]) -> None:
+    await paginator.stop_paginator(interaction)
+
+
+async def _choose_page(paginator: ButtonPaginator[Any], interaction: discord.Interaction[Any]) -> None:
+    if switcher_view := paginator._stop_button_and_page_switcher_view:
+        await interaction.response.send_message(view=switcher_view, ephemeral=True)
+        return
+
+    # the modal switches the page itself, no need to wait for it here
+    await interaction.response.send_modal(ChooseNumber(paginator, switch_page=True))
+
+
+_NAVIGATION_ACTIONS: dict[str, Callable[["ButtonPaginator[Any]"], int]] = {
+    _CID_FIRST: _go_first,
+    _CID_LEFT: _go_left,
+    _CID_RIGHT: _go_right,
+    _CID_LAST: _go_last,
+}
+_ButtonAction = Callable[["ButtonPaginator[Any]", discord.Interaction[Any]], Coroutine[Any, Any, None]]
+_BUTTON_ACTIONS: dict[str, _ButtonAction] = {
+    _CID_STOP: _stop,
+    _CID_PAGE_INDICATOR: _choose_page,
+}
+
+
 class PaginatorButton(Button[Union["ButtonPaginator[Any]", PageSwitcherAndStopButtonView]]):
     """A button for the paginator.
 
@@ -184,30 +251,14 @@ class PaginatorButton(Button[Union["ButtonPaginator[Any]", PageSwitcherAndStopBu
             await self.view.callback(interaction, self)
             return
 
-        if self.custom_id == "stop_button":
-            await self.view.stop_paginator(interaction)
-            return
-
-        if self.custom_id == "right_button":
-            self.view.current_page += 1
-        elif self.custom_id == "left_button":
-            self.view.current_page -= 1
-        elif self.custom_id == "first_button":
-            self.view.current_page = 0
-        elif self.custom_id == "last_button":
-            self.view.current_page = self.view.max_pages - 1
-        elif self.custom_id == "page_indicator_button":
-            if self.view._stop_button_and_page_switcher_view:
-                await interaction.response.send_message(view=self.view._stop_button_and_page_switcher_view, ephemeral=True)
-                return
-
-            new_page = await self.view._handle_modal(interaction)
-            if new_page is not None:
-                self.view.current_page = new_page
-            else:
-                return
-
-        await self.view.switch_page(interaction, self.view.current_page)
+        custom_id: str = self.custom_id  # type: ignore # custom_id is set in __add_buttons
+        if (navigate := _NAVIGATION_ACTIONS.get(custom_id)) is not None:
+            await self.view.switch_page(interaction, navigate(self.view))
+        elif (action := _BUTTON_ACTIONS.get(custom_id)) is not None:
+            await action(self.view, interaction)
+        elif not interaction.response.is_done():
+            # not one of the paginator's buttons, still acknowledge the interaction so it doesn't fail.
+            await interaction.response.defer()
 
     def _copy(self) -> PaginatorButton:
         """Create a copy of the button.
@@ -220,6 +271,26 @@ class PaginatorButton(Button[Union["ButtonPaginator[Any]", PageSwitcherAndStopBu
         return PaginatorButton(**self.__original_kwargs)
 
 
+def _button_sort_key(item: tuple[str, PaginatorButton]) -> int:
+    name, button = item
+    # a button without a position keeps the position of the default button it replaces
+    return button.position if button.position is not None else _DEFAULT_BUTTONS[name].position  # type: ignore
+
+
+# shared by all paginators, these are never changed or added to a view, only copied. See ButtonPaginator.__add_buttons.
+# read-only, each paginator starts from its own copy in ButtonPaginator.__init__.
+_DEFAULT_BUTTONS: MappingProxyType[ValidButtonKeys, PaginatorButton] = MappingProxyType(
+    {
+        "FIRST": PaginatorButton(label="First", position=0),
+        "LEFT": PaginatorButton(label="Left", position=1),
+        "PAGE_INDICATOR": PaginatorButton(label="Page N/A / N/A", position=2, disabled=False),
+        "RIGHT": PaginatorButton(label="Right", position=3),
+        "LAST": PaginatorButton(label="Last", position=4),
+        "STOP": PaginatorButton(label="Stop", style=ButtonStyle.danger, position=5),
+    }
+)
+
+
 class ButtonPaginator(BaseClassPaginator[PageT]):
     """A paginator that uses buttons to switch pages.
 
@@ -302,36 +373,35 @@ class ButtonPaginator(BaseClassPaginator[PageT]):
         **kwargs: Unpack[BasePaginatorKwargs],
     ) -> None:
         """Initialize the Paginator."""
+        # (at first page, at last page, max pages) of the last _update_buttons_state, see current_page
+        self.__buttons_state: Optional[tuple[bool, bool, int]] = None
         super().__init__(pages, **kwargs)
 
-        DEFAULT_BUTTONS: dict[ValidButtonKeys, PaginatorButton] = {
-            "FIRST": PaginatorButton(label="First", position=0),
-            "LEFT": PaginatorButton(label="Left", position=1),
-            "PAGE_INDICATOR": PaginatorButton(label="Page N/A / N/A", position=2, disabled=False),
-            "RIGHT": PaginatorButton(label="Right", position=3),
-            "LAST": PaginatorButton(label="Last", position=4),
-            "STOP": PaginatorButton(label="Stop", style=ButtonStyle.danger, position=5),
-        }
-
-        self._buttons: dict[ValidButtonKeys, PaginatorButton] = DEFAULT_BUTTONS.copy()
+        self._buttons: dict[ValidButtonKeys, PaginatorButton] = _DEFAULT_BUTTONS.copy()
+        # the default buttons are already in order of their position, see __add_buttons
+        self.__buttons_need_sort: bool = False
         if buttons:
-            valid_keys = ", ".join(DEFAULT_BUTTONS.keys())
+            valid_keys = ", ".join(_DEFAULT_BUTTONS.keys())
             error_message = (
                 f"buttons must be a dictionary of keys: {valid_keys} and PaginatorButton or None "
                 "to remove the button as the value. Or don't specify the kwarg to use the default buttons."
             )
             if (
                 not isinstance(buttons, dict)
-                or any(k not in DEFAULT_BUTTONS for k in buttons)
+                or not buttons.keys() <= _DEFAULT_BUTTONS.keys()
                 or not all(not v or isinstance(v, PaginatorButton) for v in buttons.values())
             ):
                 raise TypeError(error_message)
 
             self._buttons.update(buttons)
+            # a button without a position keeps the position of the default button it replaces
+            self.__buttons_need_sort = any(
+                button and button.position not in (None, _DEFAULT_BUTTONS[name].position) for name, button in buttons.items()
+            )
 
-        self._stop_button_and_page_switcher_view: Optional[PageSwitcherAndStopButtonView] = (
-            PageSwitcherAndStopButtonView(self) if combine_switcher_and_stop_button else None
-        )
+        self._combine_switcher_and_stop_button: bool = combine_switcher_and_stop_button
+        # built the first time it's needed, see _stop_button_and_page_switcher_view
+        self.__stop_button_and_page_switcher_view: Optional[PageSwitcherAndStopButtonView] = None
 
         self.always_show_stop_button: bool = always_show_stop_button
 
@@ -354,8 +424,9 @@ class ButtonPaginator(BaseClassPaginator[PageT]):
             raise ValueError("STOP button is required if always_show_stop_button is True.")
 
         name = "STOP"
-        button = self._buttons[name]
-        button.custom_id = f"{name.lower()}_button"
+        # copied since the original might be one of the default buttons
+        button = self._buttons[name]._copy()
+        button.custom_id = _CUSTOM_IDS[name]
         setattr(self, name, button)
         self.add_item(button)
 
@@ -366,7 +437,8 @@ class ButtonPaginator(BaseClassPaginator[PageT]):
         return modal.value
 
     def __add_buttons(self) -> None:
-        if not self.max_pages > 1:
+        max_pages = self.max_pages
+        if not max_pages > 1:
             if self.always_show_stop_button:
                 self.__handle_always_show_stop_button()
                 return
@@ -374,77 +446,117 @@ class ButtonPaginator(BaseClassPaginator[PageT]):
             self.stop()
             return
 
-        _buttons: dict[str, PaginatorButton] = {name: button._copy() for name, button in self._buttons.copy().items() if button}
-        sorted_buttons = sorted(_buttons.items(), key=lambda b: b[1].position if b[1].position is not None else 0)
-        for name, button in sorted_buttons:
-            custom_id = f"{name.lower()}_button"
+        # the first and last buttons aren't added with 2 pages or less, so they're not copied either
+        skip = _EDGE_BUTTON_KEYS if max_pages <= 2 else ()
+        _buttons: list[tuple[str, PaginatorButton]] = [
+            (name, button._copy()) for name, button in self._buttons.items() if button and name not in skip
+        ]
+        if self.__buttons_need_sort:
+            _buttons.sort(key=_button_sort_key)
+
+        if self._combine_switcher_and_stop_button:
+            # the view is only built when it's first sent, but the buttons are checked right away.
+            # _buttons always has every key, a removed button is None.
+            if not (self._buttons["STOP"] and self._buttons["PAGE_INDICATOR"]):
+                raise ValueError("STOP and PAGE_INDICATOR buttons are required if combine_switcher_and_stop_button is True.")
+
+        # the initial state for the first page is set here, same as _update_buttons_state would.
+        style_if_clickable = self._style_if_clickable
+        for name, button in _buttons:
+            custom_id = _CUSTOM_IDS[name]
             button.custom_id = custom_id
 
             setattr(self, name, button)
 
-            if button.custom_id == "page_indicator_button":
+            if custom_id in _BACKWARD_BUTTONS:
+                button.disabled = True
+            elif custom_id in _FORWARD_BUTTONS:
+                button.disabled = False
+                if style_if_clickable is not None:
+                    button.style = style_if_clickable
+
+            if custom_id == _CID_PAGE_INDICATOR:
                 button.label = self.page_string
-                if self.max_pages <= 2:
+                if max_pages <= 2:
                     button.disabled = True
 
-            if button.custom_id in ("first_button", "last_button"):
-                if self.max_pages <= 2:
-                    continue
-
-                label = button.label if button.label else ''
-                if button.custom_id == "first_button":
-                    button.label = f"1 {label}"
+            if custom_id in _EDGE_BUTTONS:
+                label = button.label
+                if custom_id == _CID_FIRST:
+                    button.label = f"1 {label}" if label else "1"
                 else:
-                    button.label = f"{label} {self.max_pages}"
+                    button.label = f"{label} {max_pages}" if label else str(max_pages)
 
-            if self._stop_button_and_page_switcher_view and button.custom_id == "stop_button":
+            if self._combine_switcher_and_stop_button and custom_id == _CID_STOP:
                 continue
 
             self.add_item(button)
 
-        if self._stop_button_and_page_switcher_view:
-            self._stop_button_and_page_switcher_view._add_buttons(self)
+        self.__buttons_state = (True, False, max_pages)
 
-        self._update_buttons_state()
+    @property
+    def _stop_button_and_page_switcher_view(self) -> Optional[PageSwitcherAndStopButtonView]:
+        """Optional[PageSwitcherAndStopButtonView]: The view that is sent when the page indicator is clicked
+        if ``combine_switcher_and_stop_button`` is ``True``. It's built the first time this is accessed.
+        """
+        if not self._combine_switcher_and_stop_button:
+            return None
 
-    def _update_buttons_state(self) -> None:
-        for button in self.children:
-            # type checker
-            if not isinstance(button, PaginatorButton):
-                continue
+        if self.__stop_button_and_page_switcher_view is None:
+            view = PageSwitcherAndStopButtonView(self)
+            view._add_buttons(self)
+            self.__stop_button_and_page_switcher_view = view
 
-            # type checker
-            if not button.custom_id:
-                raise ValueError("Something went wrong... button.custom_id is None")
+        return self.__stop_button_and_page_switcher_view
 
-            original_button = self._buttons.get(f"{button.custom_id.split('_')[0].upper()}")  # type: ignore
+    def __update_page_indicator(self) -> None:
+        page_indicator = self.PAGE_INDICATOR
+        # the page strings are reused so this is mostly an identity check
+        if page_indicator is not None and page_indicator.label != (page_string := self.page_string):
+            page_indicator.label = page_string
 
-            if button.custom_id in ("page_indicator_button", "stop_button"):
-                if button.custom_id == "page_indicator_button":
-                    button.label = self.page_string
+    def _update_buttons_state(self) -> None:
+        max_pages = self.max_pages
+        at_start = self._current_page <= 0
+        at_end = self._current_page >= max_pages - 1
+        # the label of the last button is set in __add_buttons and only changes with the max pages
+        relabel_last = self.__buttons_state is None or self.__buttons_state[2] != max_pages
+        self.__buttons_state = (at_start, at_end, max_pages)
+
+        self.__update_page_indicator()
+
+        # the buttons are found through the children by their custom_id, the FIRST, LEFT, RIGHT and LAST
+        # attributes are None for buttons that weren't added. The first and last buttons are always
+        # disabled with 2 pages or less.
+        no_edge_buttons = max_pages <= 2
+        disabled_by_custom_id = {
+            _CID_FIRST: at_start or no_edge_buttons,
+            _CID_LEFT: at_start,
+            _CID_RIGHT: at_end,
+            _CID_LAST: at_end or no_edge_buttons,
+        }
+        style_if_clickable = self._style_if_clickable
+        for child in self.children:
+            if not isinstance(child, Button):
                 continue
 
-            if button.custom_id in ("right_button", "last_button"):
-                button.disabled = self._current_page >= self.max_pages - 1
-            elif button.custom_id in ("left_button", "first_button"):
-                button.disabled = self._current_page <= 0
-
-            if button.custom_id in ("first_button", "last_button"):
-                if self.max_pages <= 2:
-                    button.disabled = True
+            custom_id = child.custom_id
+            disabled = disabled_by_custom_id.get(custom_id)  # type: ignore # custom_id is a str for buttons
+            if disabled is None:
+                continue
 
-                if original_button:
-                    label = original_button.label if original_button.label else ''
-                    if button.custom_id == "first_button":
-                        button.label = f"1 {label}"
-                    else:
-                        button.label = f"{label} {self.max_pages}"
+            child.disabled = disabled
+            original_button = self._buttons.get(_BUTTON_KEYS[custom_id])  # type: ignore # it's a valid key
+            # the max pages can change when the pages are set
+            if relabel_last and custom_id == _CID_LAST and original_button:
+                label = original_button.label
+                child.label = f"{label} {max_pages}" if label else str(max_pages)
 
-            if self._style_if_clickable is not None:
-                if not button.disabled:
-                    button.style = self._style_if_clickable
+            if style_if_clickable is not None:
+                if not disabled:
+                    child.style = style_if_clickable
                 else:
-                    button.style = original_button.style if original_button else ButtonStyle.secondary
+                    child.style = original_button.style if original_button else ButtonStyle.secondary
 
     @property
     def current_page(self) -> int:
@@ -453,8 +565,18 @@ class ButtonPaginator(BaseClassPaginator[PageT]):
     @current_page.setter
     def current_page(self, value: int) -> None:
         self._current_page = value
-        self._update_buttons_state()
+        self.__refresh_buttons_state()
+
+    def __refresh_buttons_state(self) -> None:
+        current_page = self._current_page
+        max_pages = self.max_pages
+        if self.__buttons_state == (current_page <= 0, current_page >= max_pages - 1, max_pages):
+            # no button is enabled or disabled, only the page indicator changes.
+            self.__update_page_indicator()
+        else:
+            self._update_buttons_state()
 
     def _send(self, *args: Any, **kwargs: Any) -> Any:
-        self._update_buttons_state()
+        # the buttons are usually already up to date from the current_page setter or __add_buttons
+        self.__refresh_buttons_state()
         return super()._send(*args, **kwargs)
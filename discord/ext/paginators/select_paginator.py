@@ -11,7 +11,7 @@ from typing import (
 from collections.abc import Sequence
 
 from copy import deepcopy
-import os
+import itertools
 
 import discord
 
@@ -161,17 +161,21 @@ class SelectOptionsPaginator(BaseClassPaginator[PageT]):
             **kwargs,
         )
         self.current_option_index: int = 0
+        # the index of each option in the select by its value, see __set_options
+        self.__option_indexes: dict[str, int] = {}
 
-    def _ensure_unique_value(self, option: Optional[discord.SelectOption]) -> Optional[discord.SelectOption]:
+    def _ensure_unique_value(self, option: Optional[discord.SelectOption], position: int) -> Optional[discord.SelectOption]:
         if not option:
             return None
 
         if option.value != option.label:
             return option
 
+        # the position of the option in the paginator makes the value unique,
+        # the label is cut off instead of the suffix if it's too long.
+        suffix = f";position={position}"
         new_option = deepcopy(option)
-        new_option.value += str(os.urandom(16).hex()) if option.value == option.label else ""
-        new_option.value = new_option.value[:99]
+        new_option.value = f"{option.value[: 99 - len(suffix)]}{suffix}"
         return new_option
 
     def _get_default_option_per_page(self, page: Any) -> discord.SelectOption:
@@ -188,25 +192,29 @@ class SelectOptionsPaginator(BaseClassPaginator[PageT]):
         return discord.SelectOption(label=label or "Untitled")
 
     def _construct_options(self, pages: Sequence[Sequence[PageT]]) -> list[list[PaginatorOption[PageT]]]:
+        positions = itertools.count()
+
         def actual_construct(page: Union[PageT, PaginatorOption[PageT]]) -> PaginatorOption[PageT]:
             if isinstance(page, PaginatorOption):
                 return page  # type: ignore # it's a PaginatorOption
 
             return PaginatorOption._from_page(
                 page,
-                self._ensure_unique_value(self.default_option or self._get_default_option_per_page(page)),
+                self._ensure_unique_value(self.default_option or self._get_default_option_per_page(page), next(positions)),
             )
 
         res: list[list[PaginatorOption[PageT]]] = []
         options: list[PaginatorOption[PageT]] = []
-        nested_options: list[PaginatorOption[PageT]] = []
 
+        # single pass: a Sequence becomes its own select right away and
+        # everything else is collected to be chunked into selects below.
         for page in pages:
             # Sequence
             if isinstance(page, (list, tuple)):
                 if len(page) == 0:
                     continue
 
+                nested_options: list[PaginatorOption[PageT]] = []
                 for item in page:
                     if isinstance(item, (list, tuple)):
                         raise TypeError("Nested lists are not supported")
@@ -218,21 +226,18 @@ class SelectOptionsPaginator(BaseClassPaginator[PageT]):
                         f"Too many options for one select in nested list (max: {self.per_select}, got: {len(nested_options)})"
                     )
 
-                options.append(nested_options)  # type: ignore # dw, it's a list of PaginatorOption
-                nested_options = []
+                res.append(nested_options)
             else:
                 options.append(actual_construct(page))  # type: ignore # Sequence is handled above
 
-        for option in options:
-            if isinstance(option, list):
-                res.append(option)
-                options.remove(option)
-
-        if len(options) > 0:
-            res.extend(discord.utils.as_chunks(options, self.per_select))
+        per_select = self.per_select
+        res.extend(options[i : i + per_select] for i in range(0, len(options), per_select))
 
         return res
 
+    def _get_page_kwargs_cache_key(self) -> Any:
+        return self._current_page, self.current_option_index
+
     def get_page(self, page_number: int) -> Union[PageT, Sequence[PageT]]:
         page: Sequence[PaginatorOption[PageT]] = super().get_page(page_number)  # type: ignore # it's a list of PaginatorOption
 
@@ -240,10 +245,15 @@ class SelectOptionsPaginator(BaseClassPaginator[PageT]):
         option.default = True
         return option.content
 
+    def __set_options(self, page_number: int) -> list[PaginatorOption[PageT]]:
+        options: list[PaginatorOption[PageT]] = self.pages[page_number]  # type: ignore # it's a list of PaginatorOption
+        self.select_page.options = options  # type: ignore
+        self.__option_indexes = {option.value: index for index, option in enumerate(options)}
+        return options
+
     async def switch_page(self, interaction: Optional[discord.Interaction[Any]], page_number: int) -> None:
         self.current_option_index = 0
-        self.select_page.options = self.pages[page_number]  # type: ignore
-        for option in self.select_page.options:  # type: ignore
+        for option in self.__set_options(page_number):
             option.default = False
 
         self.select_page.placeholder = f"Select a page | {self.page_string}"
@@ -254,17 +264,19 @@ class SelectOptionsPaginator(BaseClassPaginator[PageT]):
 
     async def switch_options(self, interaction: discord.Interaction[Any]) -> None:
         selected: str = self.select_page.values[0]
-        for idx, option in enumerate(self.select_page.options):
-            if option.label == selected or option.value == selected:
-                self.current_option_index = idx
-                option.default = True
-            else:
-                option.default = False
-
-        page = self.get_page(self.current_page)
-        self.select_page.options = self.pages[self.current_page]  # type: ignore
-        kwrgs = await self.get_page_kwargs(page)
-        self._handle_page_string()
+        index = self.__option_indexes.get(selected, self.current_option_index)
+        # only the current option is the default, see switch_page and _send
+        options = self.select_page.options
+        options[self.current_option_index].default = False
+        options[index].default = True
+        self.current_option_index = index
+
+        # acknowledged right away like in switch_page if the page might take a while.
+        if not interaction.response.is_done() and self._is_slow_to_render():
+            await interaction.response.defer()
+
+        # cached per option if cache_page_kwargs is True, see _get_page_kwargs_cache_key
+        kwrgs = await self._get_current_page_kwargs()
         await self._edit_message(interaction, **kwrgs)
 
     @discord.ui.button(label="Previous", style=discord.ButtonStyle.blurple, row=1)
@@ -290,8 +302,7 @@ class SelectOptionsPaginator(BaseClassPaginator[PageT]):
         await self.switch_options(interaction)
 
     async def _send(self, *args: Any, **kwargs: Any) -> Optional[discord.Message]:
-        self.select_page.options = self.pages[0]  # type: ignore # nothing really possible to do here
-        self.select_page.options[0].default = True  # type: ignore # nothing really possible to do here
+        self.__set_options(0)[0].default = True
         self.select_page.placeholder = f"Select a page | {self.page_string}"
         self.previous_page.disabled = True
         self.next_page.disabled = self.max_pages == 1
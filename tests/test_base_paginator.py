@@ -0,0 +1,123 @@
+import asyncio
+from typing import Any, Sequence, Union
+
+from discord.ext.paginators.base_paginator import BaseClassPaginator
+
+
+def test_range_pages_per_page() -> None:
+    paginator = BaseClassPaginator(range(10), per_page=2)
+
+    assert paginator.max_pages == 5
+    assert paginator.get_page(0) == [0, 1]
+    assert paginator.get_page(4) == [8, 9]
+
+    async def get_kwargs() -> None:
+        page_kwargs = await paginator.get_page_kwargs(paginator.get_page(1))
+        assert page_kwargs["content"] == "23"
+
+    asyncio.run(get_kwargs())
+
+
+class _Response:
+    def __init__(self) -> None:
+        self.done = False
+
+    def is_done(self) -> bool:
+        return self.done
+
+    async def defer(self) -> None:
+        self.done = True
+        await asyncio.sleep(0)
+
+    async def edit_message(self, **kwargs: Any) -> None:
+        self.done = True
+
+
+class _Interaction:
+    def __init__(self, edits: list[dict[str, Any]]) -> None:
+        self.message = None
+        self.response = _Response()
+        self.edits = edits
+
+    async def edit_original_response(self, **kwargs: Any) -> None:
+        self.edits.append(kwargs)
+
+
+class _SlowPaginator(BaseClassPaginator[str]):
+    async def format_page(self, page: Union[str, Sequence[str]]) -> Union[str, Sequence[str]]:
+        await asyncio.sleep(0.01)
+        return page
+
+
+def test_concurrent_switch_page() -> None:
+    async def switch() -> None:
+        paginator = _SlowPaginator([str(number) for number in range(10)])
+        edits: list[dict[str, Any]] = []
+        await asyncio.gather(
+            paginator.switch_page(_Interaction(edits), 1),  # type: ignore # a fake interaction
+            paginator.switch_page(_Interaction(edits), 2),  # type: ignore # a fake interaction
+        )
+
+        assert all(edit["content"].count("Page") == 1 for edit in edits)
+        assert edits[-1]["content"] == "2\nPage 3 of 10"
+
+    asyncio.run(switch())
+
+
+def test_switch_page_while_formatting() -> None:
+    async def switch() -> None:
+        paginator = _SlowPaginator([str(number) for number in range(10)])
+        edits: list[dict[str, Any]] = []
+        first = asyncio.create_task(paginator.switch_page(_Interaction(edits), 1))  # type: ignore # a fake interaction
+        await asyncio.sleep(0.005)
+        await paginator.switch_page(_Interaction(edits), 2)  # type: ignore # a fake interaction
+        await first
+
+        # the first page is not sent with the page string of the second one.
+        assert [edit["content"] for edit in edits] == ["2\nPage 3 of 10"]
+
+    asyncio.run(switch())
+
+
+class _CountingPaginator(BaseClassPaginator[str]):
+    formatted: list[Any]
+
+    async def format_page(self, page: Union[str, Sequence[str]]) -> Union[str, Sequence[str]]:
+        self.formatted.append(page)
+        await asyncio.sleep(0)
+        return page
+
+
+def test_cache_page_kwargs() -> None:
+    async def render(paginator: _CountingPaginator, page_number: int) -> Any:
+        paginator.current_page = page_number
+        return (await paginator._get_current_page_kwargs())["content"]
+
+    async def cache() -> None:
+        paginator = _CountingPaginator(["a", "b", "c"], cache_page_kwargs=True)
+        paginator.formatted = []
+
+        assert await render(paginator, 0) == "a\nPage 1 of 3"
+        assert await render(paginator, 1) == "b\nPage 2 of 3"
+        assert await render(paginator, 0) == "a\nPage 1 of 3"
+        assert await render(paginator, 1) == "b\nPage 2 of 3"
+        assert paginator.formatted == ["a", "b"]
+
+        paginator.pages = ["d", "e"]
+        assert await render(paginator, 0) == "d\nPage 1 of 2"
+
+        paginator.per_page = 2
+        assert await render(paginator, 0) == "de\nPage 1 of 1"
+        assert paginator.formatted == ["a", "b", "d", ["d", "e"]]
+
+        # not cached if the page is switched while it's formatted.
+        paginator.pages = ["f", "g"]
+        paginator.per_page = 1
+        render_first = asyncio.create_task(render(paginator, 0))
+        await asyncio.sleep(0)
+        paginator.current_page = 1
+        assert await render_first == "f\nPage 1 of 2"
+        assert await render(paginator, 0) == "f\nPage 1 of 2"
+        assert paginator.formatted[-2:] == ["f", "f"]
+
+    asyncio.run(cache())